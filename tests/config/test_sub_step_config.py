@@ -625,4 +625,80 @@ class TestTSSCSubStepConfig(BaseTSSCTestCase):
             sub_step.get_config_value('step-foo-foo1-override-by-step-env-config', 'env2'),
             "step-foo-foo-env2")
 
-        self.assertIsNone(sub_step.get_config_value('does-not-exist'))
\ No newline at end of file
+        self.assertIsNone(sub_step.get_config_value('does-not-exist'))
+
+    def test_get_config_value_defaults(self):
+        tssc_config = Config({
+            Config.TSSC_CONFIG_KEY: {
+                'global-defaults': {
+                    'global-default-override-default': 'global-default'
+                },
+                'step-foo': [
+                    {
+                        'implementer': 'foo1',
+                        'config': {
+                            'step-foo-foo1-override-default': 'step-foo-foo1'
+                        }
+                    }
+                ]
+            }
+        })
+
+        step_config = tssc_config.get_step_config('step-foo')
+        sub_step = step_config.get_sub_step('foo1')
+        defaults = {
+            'default-unique': 'default',
+            'global-default-override-default': 'default-override-me',
+            'step-foo-foo1-override-default': 'default-override-me'
+        }
+
+        self.assertEqual(
+            sub_step.get_config_value('default-unique', defaults=defaults),
+            "default")
+        self.assertEqual(
+            sub_step.get_config_value('global-default-override-default', defaults=defaults),
+            "global-default")
+        self.assertEqual(
+            sub_step.get_config_value('step-foo-foo1-override-default', defaults=defaults),
+            "step-foo-foo1")
+        self.assertIsNone(sub_step.get_config_value('does-not-exist', defaults=defaults))
+
+    def test_get_copy_of_runtime_step_config_is_copy(self):
+        tssc_config = Config({
+            Config.TSSC_CONFIG_KEY: {
+                'global-defaults': {
+                    'global-default-list': ['global-default']
+                },
+                'step-foo': [
+                    {
+                        'implementer': 'foo1',
+                        'config': {
+                            'step-foo-foo1-dict': {'step-foo-foo1': 'step-foo-foo1'}
+                        }
+                    }
+                ]
+            }
+        })
+
+        step_config = tssc_config.get_step_config('step-foo')
+        sub_step = step_config.get_sub_step('foo1')
+        defaults = {
+            'default-list': ['default']
+        }
+
+        runtime_step_config = sub_step.get_copy_of_runtime_step_config(defaults=defaults)
+        runtime_step_config['default-list'].append('modified')
+        runtime_step_config['global-default-list'].append('modified')
+        runtime_step_config['step-foo-foo1-dict']['step-foo-foo1'] = 'modified'
+
+        self.assertEqual(defaults, {'default-list': ['default']})
+        self.assertEqual(
+            ConfigValue.convert_leaves_to_values(
+                sub_step.get_copy_of_runtime_step_config(defaults=defaults)
+            ),
+            {
+                'default-list': ['default'],
+                'global-default-list': ['global-default'],
+                'step-foo-foo1-dict': {'step-foo-foo1': 'step-foo-foo1'}
+            }
+        )
@@ -1,11 +1,16 @@
+import json
+import os
 import shutil
 import tempfile
 import types
 import unittest
+from datetime import datetime, timezone
 from io import IOBase
 from unittest.mock import MagicMock, patch
 
+import jinja2
 import sh
+import yaml
 from testfixtures import TempDirectory
 from tests.helpers.base_step_implementer_test_case import \
     BaseStepImplementerTestCase
@@ -13,9 +18,16 @@ from tests.helpers.base_tssc_test_case import BaseTSSCTestCase
 from tests.helpers.test_utils import *
 from tssc.config.config import Config
 from tssc.step_implementers.deploy import ArgoCD
+from tssc.step_implementers.deploy.argocd import (GIT_CREDENTIAL_HELPER_CONFIG,
+                                                   _get_run_timestamp,
+                                                   _get_template)
 
 
 class TestStepImplementerDeployArgoCD(BaseStepImplementerTestCase):
+    def setUp(self):
+        super().setUp()
+        _get_run_timestamp.cache_clear()
+
     @staticmethod
     def __create_git_rev_parse_side_effect(abbreviated_ref):
         def git_rev_parse_side_effect(*args, **kwargs):
@@ -394,10 +406,10 @@ class TestStepImplementerDeployArgoCD(BaseStepImplementerTestCase):
                 _err=Any(IOBase)
             )
 
-    @patch('shutil.copyfile', create=True)
+    @patch('jinja2.environment.TemplateStream.dump')
     @patch('sh.git', create=True)
     @patch('sh.argocd', create=True)
-    def test_deploy_argo_copyfile_error(self, argocd_mock, git_mock, shutil_mock):
+    def test_deploy_argo_values_file_write_error(self, argocd_mock, git_mock, dump_mock):
 
         application_name = 'app-name'
         service_name = 'service-name'
@@ -499,9 +511,9 @@ class TestStepImplementerDeployArgoCD(BaseStepImplementerTestCase):
             }
 
             git_mock.side_effect=self.git_rev_parse_side_effect
-            shutil_mock.side_effect = OSError
+            dump_mock.side_effect = OSError
 
-            with self.assertRaises(RuntimeError):
+            with self.assertRaisesRegex(RuntimeError, 'Error writing ./values-env-name.yaml file'):
                 self.run_step_test_with_result_validation(
                     temp_dir=temp_dir,
                     step_name='deploy',
@@ -617,7 +629,13 @@ class TestStepImplementerDeployArgoCD(BaseStepImplementerTestCase):
             }
 
             git_mock.side_effect=self.git_rev_parse_side_effect
-            argocd_mock.app.get.side_effect = sh.ErrorReturnCode_1('argocd', b'stdout', b'stderror')
+
+            rendered_values_files = []
+            def git_add_side_effect(*args, **kwargs):
+                repo_directory = git_mock.bake.call_args_list[0][1]['_cwd']
+                with open(os.path.join(repo_directory, args[0])) as values_file:
+                    rendered_values_files.append(values_file.read())
+            git_mock.bake.return_value.add.side_effect = git_add_side_effect
 
             self.run_step_test_with_result_validation(
                 temp_dir=temp_dir,
@@ -636,29 +654,446 @@ class TestStepImplementerDeployArgoCD(BaseStepImplementerTestCase):
                 _err=Any(IOBase)
             )
 
-            argocd_mock.app.get.assert_called_once_with(
-               organization_name + '-' + application_name + '-' + service_name + '-testbranch-' + environment_name,
-                _out=Any(IOBase),
-                _err=Any(IOBase)
+            argocd_mock.app.bake.return_value.get.assert_called_once_with(
+                organization_name + '-' + application_name + '-' + service_name + '-testbranch-' + environment_name,
+                '--output=json',
+                _out=None
             )
-            argocd_mock.app.create.assert_called_once_with(
+            argocd_mock.app.bake.return_value.create.assert_called_once_with(
                 organization_name + '-' + application_name + '-' + service_name + '-testbranch-' + environment_name,
+                '--upsert',
                 '--repo=' + helm_config_repo,
                 '--revision=testbranch',
                 '--path=' + argocd_helm_chart_path,
                 '--dest-server=' + kube_api_uri,
                 '--dest-namespace=' + organization_name + '-' + application_name + '-' + service_name + '-testbranch-' + environment_name,
                 '--sync-policy=none',
-                '--values=values-{env}.yaml'.format(env=environment_name),
+                '--values=values-{env}.yaml'.format(env=environment_name)
+            )
+            argocd_mock.app.bake.assert_called_once_with(
                 _out=Any(IOBase),
                 _err=Any(IOBase)
             )
 
             git_mock.clone.assert_called_once()
+            self.assertEqual(rendered_values_files[0].strip(), '3')
+
+    @patch('sh.git', create=True)
+    @patch('sh.argocd', create=True)
+    def test_deploy_argo_values_file_unchanged(self, argocd_mock, git_mock):
+
+        application_name = 'app-name'
+        service_name = 'service-name'
+        organization_name = 'org-name'
+        environment_name = 'env-name'
+        kube_app_domain = 'apps.tssc.rht-set.com'
+        git_tag = 'v1.2.3'
+        argocd_username = 'username'
+        argocd_password = 'password'
+        image_tag = 'not_latest'
+        image_url = 'quay.io/tssc/myimage'
+        helm_config_repo = 'http://gitrepo.com/helm-confg-repo.git'
+        argocd_api = 'http://argocd.example.com'
+        argocd_helm_chart_path = './'
+        kube_api_uri = 'https://kubernetes.default.svc'
+        deployment_namespace = 'dev'
+
+        with TempDirectory() as temp_dir:
+            temp_dir.makedir('tssc-results')
+
+            temp_dir.write(
+                'tssc-results/tssc-results.yml',
+                bytes(
+                    '''tssc-results:
+                  generate-metadata:
+                    container-image-version: {image_tag}
+                  tag-source:
+                    tag: {git_tag}
+                  push-container-image:
+                    container-image-uri: {image_url}
+                '''.format(image_tag=image_tag, image_url=image_url, git_tag=git_tag),
+                    'utf-8')
+                )
+            temp_dir.write(
+                'values.yaml.j2',
+                bytes(
+                   '''
+                   {{ num_replicas }}
+                   ''', 'utf-8'
+                )
+            )
+            config = {
+                'tssc-config': {
+                    'global-defaults' : {
+                        'service-name' : service_name,
+                        'application-name' : application_name,
+                        'organization' : organization_name,
+                        'kube-app-domain' : 'apps.tssc.rht-set.com',
+                        'git-email' : 'nappspo+tssc@redhat.com'
+                    },
+                    'deploy' : {
+                        'implementer': 'ArgoCD',
+                        'config': {
+                            'argocd-username' : argocd_username,
+                            'argocd-password' : argocd_password,
+                            'argocd-api' : argocd_api,
+                            'helm-config-repo' : helm_config_repo,
+                            'argocd-sync-timeout-seconds' : '60',
+                            'num-replicas' : '3',
+                            'ingress-enabled' : 'true',
+                            'readiness-probe-path' : '/ready',
+                            'liveness-probe-path' : '/live',
+                            'values-yaml-directory': temp_dir.path
+                        }
+                    }
+                }
+            }
+
+            repo_branch_name = 'testbranch'
+            expected_step_results = {
+                'tssc-results': {
+                    'generate-metadata' : {
+                        'container-image-version' : image_tag
+                    },
+                    'push-container-image' : {
+                        'container-image-uri' : image_url
+                    },
+                    'tag-source' : {
+                        'tag' : git_tag
+                    },
+                    'deploy': {
+                        'result': {
+                            'success': True,
+                            'message': 'deploy step completed - see report-artifacts',
+                            'argocd-app-name' : f'{organization_name}-{application_name}-{service_name}-{repo_branch_name}-{environment_name}',
+                            'config-repo-git-tag' :  f'{git_tag}.HASH',
+                            'deploy-endpoint-url': f'http://{service_name}.{organization_name}-{application_name}-{service_name}-{repo_branch_name}-{environment_name}.{kube_app_domain}'
+                        },
+                        'report-artifacts': [
+                        {
+                            'name' : 'argocd-result-set',
+                            'path': f'file://{temp_dir.path}/tssc-working/deploy/deploy_argocd_manifests.yml'
+                        }
+                        ]
+                    }
+                }
+            }
+
+            runtime_args = {
+                'git-username': 'unit_test_username',
+                'git-password': 'unit_test_password'
+            }
+
+            git_mock.side_effect=self.git_rev_parse_side_effect
+
+            self.run_step_test_with_result_validation(
+                temp_dir=temp_dir,
+                step_name='deploy',
+                config=config,
+                expected_step_results=expected_step_results,
+                runtime_args=runtime_args,
+                environment=environment_name)
+
+            git_mock.bake.return_value.diff.assert_called_once_with(
+                '--cached',
+                '--quiet',
+                _out=os.devnull
+            )
+            git_mock.bake.return_value.commit.assert_not_called()
+            git_mock.tag.assert_called_once_with(
+                f'{git_tag}.HASH',
+                '-f',
+                _out=Any(IOBase),
+                _err=Any(IOBase),
+                _cwd=Any(str)
+            )
+            git_mock.bake.return_value.push.bake.assert_called_once_with(helm_config_repo)
+            git_mock.bake.return_value.push.bake.return_value.assert_called_once_with(
+                '--tag',
+                _out=Any(IOBase),
+                _cwd=Any(str)
+            )
+            argocd_mock.app.bake.return_value.create.assert_called_once()
+            argocd_mock.app.bake.return_value.sync.assert_called_once()
+
+    @patch('sh.git', create=True)
+    @patch('sh.argocd', create=True)
+    def test_deploy_argo_values_file_unchanged_new_branch(self, argocd_mock, git_mock):
+
+        application_name = 'app-name'
+        service_name = 'service-name'
+        organization_name = 'org-name'
+        environment_name = 'env-name'
+        kube_app_domain = 'apps.tssc.rht-set.com'
+        git_tag = 'v1.2.3'
+        argocd_username = 'username'
+        argocd_password = 'password'
+        image_tag = 'not_latest'
+        image_url = 'quay.io/tssc/myimage'
+        helm_config_repo = 'http://gitrepo.com/helm-confg-repo.git'
+        argocd_api = 'http://argocd.example.com'
+        argocd_helm_chart_path = './'
+        kube_api_uri = 'https://kubernetes.default.svc'
+        deployment_namespace = 'dev'
+
+        with TempDirectory() as temp_dir:
+            temp_dir.makedir('tssc-results')
+
+            temp_dir.write(
+                'tssc-results/tssc-results.yml',
+                bytes(
+                    '''tssc-results:
+                  generate-metadata:
+                    container-image-version: {image_tag}
+                  tag-source:
+                    tag: {git_tag}
+                  push-container-image:
+                    container-image-uri: {image_url}
+                '''.format(image_tag=image_tag, image_url=image_url, git_tag=git_tag),
+                    'utf-8')
+                )
+            temp_dir.write(
+                'values.yaml.j2',
+                bytes(
+                   '''
+                   {{ num_replicas }}
+                   ''', 'utf-8'
+                )
+            )
+            config = {
+                'tssc-config': {
+                    'global-defaults' : {
+                        'service-name' : service_name,
+                        'application-name' : application_name,
+                        'organization' : organization_name,
+                        'kube-app-domain' : 'apps.tssc.rht-set.com',
+                        'git-email' : 'nappspo+tssc@redhat.com'
+                    },
+                    'deploy' : {
+                        'implementer': 'ArgoCD',
+                        'config': {
+                            'argocd-username' : argocd_username,
+                            'argocd-password' : argocd_password,
+                            'argocd-api' : argocd_api,
+                            'helm-config-repo' : helm_config_repo,
+                            'argocd-sync-timeout-seconds' : '60',
+                            'num-replicas' : '3',
+                            'ingress-enabled' : 'true',
+                            'readiness-probe-path' : '/ready',
+                            'liveness-probe-path' : '/live',
+                            'values-yaml-directory': temp_dir.path
+                        }
+                    }
+                }
+            }
+
+            repo_branch_name = 'testbranch'
+            expected_step_results = {
+                'tssc-results': {
+                    'generate-metadata' : {
+                        'container-image-version' : image_tag
+                    },
+                    'push-container-image' : {
+                        'container-image-uri' : image_url
+                    },
+                    'tag-source' : {
+                        'tag' : git_tag
+                    },
+                    'deploy': {
+                        'result': {
+                            'success': True,
+                            'message': 'deploy step completed - see report-artifacts',
+                            'argocd-app-name' : f'{organization_name}-{application_name}-{service_name}-{repo_branch_name}-{environment_name}',
+                            'config-repo-git-tag' :  f'{git_tag}.HASH',
+                            'deploy-endpoint-url': f'http://{service_name}.{organization_name}-{application_name}-{service_name}-{repo_branch_name}-{environment_name}.{kube_app_domain}'
+                        },
+                        'report-artifacts': [
+                        {
+                            'name' : 'argocd-result-set',
+                            'path': f'file://{temp_dir.path}/tssc-working/deploy/deploy_argocd_manifests.yml'
+                        }
+                        ]
+                    }
+                }
+            }
+
+            runtime_args = {
+                'git-username': 'unit_test_username',
+                'git-password': 'unit_test_password'
+            }
+
+            git_mock.side_effect=self.git_rev_parse_no_remote_branch_side_effect
+
+            self.run_step_test_with_result_validation(
+                temp_dir=temp_dir,
+                step_name='deploy',
+                config=config,
+                expected_step_results=expected_step_results,
+                runtime_args=runtime_args,
+                environment=environment_name)
+
+            git_mock.bake.return_value.diff.assert_called_once_with(
+                '--cached',
+                '--quiet',
+                _out=os.devnull
+            )
+            git_mock.bake.return_value.checkout.assert_called_once_with('-b', repo_branch_name)
+            git_mock.bake.return_value.commit.assert_not_called()
+            git_mock.tag.assert_called_once_with(
+                f'{git_tag}.HASH',
+                '-f',
+                _out=Any(IOBase),
+                _err=Any(IOBase),
+                _cwd=Any(str)
+            )
+            git_push_mock = git_mock.bake.return_value.push.bake.return_value
+            self.assertEqual(git_push_mock.call_count, 2)
+            git_push_mock.assert_any_call(_out=Any(IOBase), _cwd=Any(str))
+            git_push_mock.assert_called_with('--tag', _out=Any(IOBase), _cwd=Any(str))
+            argocd_mock.app.bake.return_value.create.assert_called_once()
+            argocd_mock.app.bake.return_value.sync.assert_called_once()
+
+    @patch('sh.git', create=True)
+    @patch('sh.argocd', create=True)
+    def test_deploy_argo_app_exists_unchanged(self, argocd_mock, git_mock):
+
+        application_name = 'app-name'
+        service_name = 'service-name'
+        organization_name = 'org-name'
+        environment_name = 'env-name'
+        kube_app_domain = 'apps.tssc.rht-set.com'
+        git_tag = 'v1.2.3'
+        argocd_username = 'username'
+        argocd_password = 'password'
+        image_tag = 'not_latest'
+        image_url = 'quay.io/tssc/myimage'
+        helm_config_repo = 'http://gitrepo.com/helm-confg-repo.git'
+        argocd_api = 'http://argocd.example.com'
+        argocd_helm_chart_path = './'
+        kube_api_uri = 'https://kubernetes.default.svc'
+        deployment_namespace = 'dev'
+
+        with TempDirectory() as temp_dir:
+            temp_dir.makedir('tssc-results')
+
+            temp_dir.write(
+                'tssc-results/tssc-results.yml',
+                bytes(
+                    '''tssc-results:
+                  generate-metadata:
+                    container-image-version: {image_tag}
+                  tag-source:
+                    tag: {git_tag}
+                  push-container-image:
+                    container-image-uri: {image_url}
+                '''.format(image_tag=image_tag, image_url=image_url, git_tag=git_tag),
+                    'utf-8')
+                )
+            temp_dir.write(
+                'values.yaml.j2',
+                bytes(
+                   '''
+                   {{ num_replicas }}
+                   ''', 'utf-8'
+                )
+            )
+            config = {
+                'tssc-config': {
+                    'global-defaults' : {
+                        'service-name' : service_name,
+                        'application-name' : application_name,
+                        'organization' : organization_name,
+                        'kube-app-domain' : 'apps.tssc.rht-set.com',
+                        'git-email' : 'nappspo+tssc@redhat.com'
+                    },
+                    'deploy' : {
+                        'implementer': 'ArgoCD',
+                        'config': {
+                            'argocd-username' : argocd_username,
+                            'argocd-password' : argocd_password,
+                            'argocd-api' : argocd_api,
+                            'helm-config-repo' : helm_config_repo,
+                            'argocd-sync-timeout-seconds' : '60',
+                            'num-replicas' : '3',
+                            'ingress-enabled' : 'true',
+                            'readiness-probe-path' : '/ready',
+                            'liveness-probe-path' : '/live',
+                            'values-yaml-directory': temp_dir.path
+                        }
+                    }
+                }
+            }
+
+            repo_branch_name = 'testbranch'
+            expected_step_results = {
+                'tssc-results': {
+                    'generate-metadata' : {
+                        'container-image-version' : image_tag
+                    },
+                    'push-container-image' : {
+                        'container-image-uri' : image_url
+                    },
+                    'tag-source' : {
+                        'tag' : git_tag
+                    },
+                    'deploy': {
+                        'result': {
+                            'success': True,
+                            'message': 'deploy step completed - see report-artifacts',
+                            'argocd-app-name' : f'{organization_name}-{application_name}-{service_name}-{repo_branch_name}-{environment_name}',
+                            'config-repo-git-tag' :  f'{git_tag}.HASH',
+                            'deploy-endpoint-url': f'http://{service_name}.{organization_name}-{application_name}-{service_name}-{repo_branch_name}-{environment_name}.{kube_app_domain}'
+                        },
+                        'report-artifacts': [
+                        {
+                            'name' : 'argocd-result-set',
+                            'path': f'file://{temp_dir.path}/tssc-working/deploy/deploy_argocd_manifests.yml'
+                        }
+                        ]
+                    }
+                }
+            }
+
+            runtime_args = {
+                'git-username': 'unit_test_username',
+                'git-password': 'unit_test_password'
+            }
+
+            git_mock.side_effect=self.git_rev_parse_side_effect
+
+            argocd_mock.app.bake.return_value.get.return_value = json.dumps({
+                'spec': {
+                    'source': {
+                        'repoURL': helm_config_repo,
+                        'targetRevision': repo_branch_name,
+                        'path': './',
+                        'helm': {
+                            'valueFiles': [f'values-{environment_name}.yaml']
+                        }
+                    },
+                    'destination': {
+                        'server': 'https://kubernetes.default.svc',
+                        'namespace': f'{organization_name}-{application_name}-{service_name}-{repo_branch_name}-{environment_name}'
+                    },
+                    'syncPolicy': {}
+                }
+            })
+
+            self.run_step_test_with_result_validation(
+                temp_dir=temp_dir,
+                step_name='deploy',
+                config=config,
+                expected_step_results=expected_step_results,
+                runtime_args=runtime_args,
+                environment=environment_name)
+
+            argocd_mock.app.bake.return_value.create.assert_not_called()
+            argocd_mock.app.bake.return_value.sync.assert_called_once()
+            argocd_mock.app.bake.return_value.wait.assert_called_once()
 
     @patch('sh.git', create=True)
     @patch('sh.argocd', create=True)
-    def test_deploy_git_checkout_error(self, argocd_mock, git_mock):
+    def test_deploy_git_config_repo_branch_missing(self, argocd_mock, git_mock):
 
         application_name = 'app-name'
         service_name = 'service-name'
@@ -762,9 +1197,7 @@ class TestStepImplementerDeployArgoCD(BaseStepImplementerTestCase):
                 'git-password': 'unit_test_password'
             }
 
-            git_mock.side_effect=self.git_rev_parse_side_effect
-
-            git_mock.checkout.side_effect = [sh.ErrorReturnCode('git', b'stdout', b'stderror'), None]
+            git_mock.side_effect=self.git_rev_parse_no_remote_branch_side_effect
 
             self.run_step_test_with_result_validation(
                 temp_dir,
@@ -783,8 +1216,15 @@ class TestStepImplementerDeployArgoCD(BaseStepImplementerTestCase):
                 _err=Any(IOBase)
             )
 
-            git_mock.clone.assert_called_once()
-
+            git_mock.clone.assert_called_once_with(
+                helm_config_repo,
+                Any(str),
+                '--depth=1',
+                '--single-branch',
+                _out=Any(IOBase),
+                _err=Any(IOBase)
+            )
+            git_mock.bake.return_value.checkout.assert_called_once_with('-b', repo_branch_name)
 
     @patch('sh.git', create=True)
     @patch('sh.argocd', create=True)
@@ -1014,7 +1454,8 @@ class TestStepImplementerDeployArgoCD(BaseStepImplementerTestCase):
             }
 
             git_mock.side_effect=self.git_rev_parse_side_effect
-            git_mock.commit.side_effect = sh.ErrorReturnCode('git', b'stdout', b'stderror')
+            git_mock.bake.return_value.diff.side_effect = sh.ErrorReturnCode_1('git', b'stdout', b'stderror')
+            git_mock.bake.return_value.commit.side_effect = sh.ErrorReturnCode('git', b'stdout', b'stderror')
 
             with self.assertRaises(RuntimeError):
                 self.run_step_test_with_result_validation(
@@ -1487,12 +1928,10 @@ class TestStepImplementerDeployArgoCD(BaseStepImplementerTestCase):
 
             git_mock.clone.assert_called_once()
 
-            argocd_mock.app.sync.assert_called_once_with(
+            argocd_mock.app.bake.return_value.sync.assert_called_once_with(
                 '--timeout',
                 argocd_sync_timeout_seconds,
-                organization_name + '-' + application_name + '-' + service_name + '-testbranch-' + environment_name,
-                _out=Any(IOBase),
-                _err=Any(IOBase)
+                organization_name + '-' + application_name + '-' + service_name + '-testbranch-' + environment_name
             )
 
     @patch('sh.git', create=True)
@@ -1600,6 +2039,7 @@ class TestStepImplementerDeployArgoCD(BaseStepImplementerTestCase):
             }
 
             git_mock.side_effect=self.git_rev_parse_side_effect
+            git_mock.bake.return_value.diff.side_effect = sh.ErrorReturnCode_1('git', b'stdout', b'stderror')
             self.run_step_test_with_result_validation(
                 temp_dir,
                 'deploy',
@@ -1617,9 +2057,38 @@ class TestStepImplementerDeployArgoCD(BaseStepImplementerTestCase):
                 _err=Any(IOBase)
             )
 
-            git_mock.clone.assert_called_once()
-            git_mock.checkout.assert_called_once()
-            git_mock.push.bake.assert_called()
+            git_mock.clone.assert_called_once_with(
+                helm_config_repo,
+                Any(str),
+                '--depth=1',
+                '--single-branch',
+                '--branch=testbranch',
+                _out=Any(IOBase),
+                _err=Any(IOBase)
+            )
+            git_mock.bake.return_value.checkout.assert_not_called()
+            git_mock.config.assert_not_called()
+            git_mock.status.assert_not_called()
+            rev_parse_short_calls = [
+                call for call in git_mock.call_args_list if call[0][:2] == ('rev-parse', '--short')
+            ]
+            self.assertEqual(len(rev_parse_short_calls), 1)
+            commit_env = git_mock.bake.return_value.commit.call_args[1]['_env']
+            self.assertEqual(commit_env['GIT_AUTHOR_EMAIL'], 'nappspo+tssc@redhat.com')
+            self.assertEqual(commit_env['GIT_COMMITTER_EMAIL'], 'nappspo+tssc@redhat.com')
+            self.assertEqual(commit_env['GIT_AUTHOR_NAME'], 'TSSC')
+            self.assertEqual(commit_env['GIT_COMMITTER_NAME'], 'TSSC')
+            git_mock.bake.assert_any_call(
+                '-c',
+                'credential.helper=',
+                '-c',
+                GIT_CREDENTIAL_HELPER_CONFIG,
+                _env=Any(dict)
+            )
+            git_push_env = git_mock.bake.call_args_list[-1][1]['_env']
+            self.assertEqual(git_push_env['TSSC_GIT_USERNAME'], 'unit_test_username')
+            self.assertEqual(git_push_env['TSSC_GIT_PASSWORD'], 'unit_test_password')
+            git_mock.bake.return_value.push.bake.assert_called_once_with(helm_config_repo)
 
     @patch('sh.git', create=True)
     @patch('sh.argocd', create=True)
@@ -1743,8 +2212,18 @@ class TestStepImplementerDeployArgoCD(BaseStepImplementerTestCase):
             )
 
             git_mock.clone.assert_called_once()
-            git_mock.checkout.assert_called_once()
-            git_mock.push.bake.assert_called()
+            git_mock.bake.return_value.checkout.assert_not_called()
+            git_mock.bake.assert_any_call(
+                '-c',
+                'credential.helper=',
+                '-c',
+                GIT_CREDENTIAL_HELPER_CONFIG,
+                _env=Any(dict)
+            )
+            git_push_env = git_mock.bake.call_args_list[-1][1]['_env']
+            self.assertEqual(git_push_env['TSSC_GIT_USERNAME'], 'unit_test_username')
+            self.assertEqual(git_push_env['TSSC_GIT_PASSWORD'], 'unit_test_password')
+            git_mock.bake.return_value.push.bake.assert_called_once_with(helm_config_repo)
 
     @patch('sh.git', create=True)
     @patch('sh.argocd', create=True)
@@ -1869,7 +2348,7 @@ class TestStepImplementerDeployArgoCD(BaseStepImplementerTestCase):
             )
 
             git_mock.clone.assert_called_once()
-            git_mock.checkout.assert_called_once()
+            git_mock.bake.return_value.checkout.assert_not_called()
             git_mock.push.assert_called()
 
     @patch('sh.git', create=True)
@@ -1993,6 +2472,15 @@ class TestStepImplementerDeployArgoCD(BaseStepImplementerTestCase):
         else:
             return 'HASH'
 
+    @staticmethod
+    def git_rev_parse_no_remote_branch_side_effect(*args, **kwargs):
+        if (args[0] == 'ls-remote'):
+            return ''
+        elif (args[1] == '--abbrev-ref'):
+            return 'testbranch'
+        else:
+            return 'HASH'
+
     @patch('sh.git', create=True)
     @patch('sh.argocd', create=True)
     def test_argo_create_cluster_norminal(self, argocd_mock, git_mock):
@@ -2098,6 +2586,13 @@ class TestStepImplementerDeployArgoCD(BaseStepImplementerTestCase):
             }
 
             git_mock.side_effect=self.git_rev_parse_side_effect
+
+            kubeconfigs = []
+            def argocd_cluster_add_side_effect(*args, **kwargs):
+                with open(args[1]) as kubeconfig_file:
+                    kubeconfigs.append(yaml.safe_load(kubeconfig_file))
+            argocd_mock.cluster.add.side_effect = argocd_cluster_add_side_effect
+
             self.run_step_test_with_result_validation(
                 temp_dir,
                 'deploy',
@@ -2116,8 +2611,30 @@ class TestStepImplementerDeployArgoCD(BaseStepImplementerTestCase):
             )
 
             git_mock.clone.assert_called_once()
-            git_mock.checkout.assert_called_once()
-            git_mock.push.bake.assert_called()
+            git_mock.bake.return_value.checkout.assert_not_called()
+            git_mock.bake.assert_any_call(
+                '-c',
+                'credential.helper=',
+                '-c',
+                GIT_CREDENTIAL_HELPER_CONFIG,
+                _env=Any(dict)
+            )
+            git_push_env = git_mock.bake.call_args_list[-1][1]['_env']
+            self.assertEqual(git_push_env['TSSC_GIT_USERNAME'], 'unit_test_username')
+            self.assertEqual(git_push_env['TSSC_GIT_PASSWORD'], 'unit_test_password')
+            git_mock.bake.return_value.push.bake.assert_called_once_with(helm_config_repo)
+            argocd_mock.cluster.add.assert_called_once_with(
+                '--kubeconfig',
+                Any(str),
+                'customcluster.ocp.com-context',
+                _out=Any(IOBase),
+                _err=Any(IOBase)
+            )
+            self.assertEqual(
+                kubeconfigs[0]['clusters'][0]['cluster'],
+                {'insecure-skip-tls-verify': True, 'server': 'customcluster.ocp.com'}
+            )
+            self.assertEqual(kubeconfigs[0]['current-context'], 'customcluster.ocp.com-context')
 
     @patch('sh.git', create=True)
     @patch('sh.argocd', create=True)
@@ -2399,3 +2916,185 @@ class TestStepImplementerDeployArgoCD(BaseStepImplementerTestCase):
             },
             environment='test'
         )
+
+    def test__get_template_cached(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('values.yaml.j2', b'{{ num_replicas }}')
+
+            template = _get_template(temp_dir.path, 'values.yaml.j2')
+
+            self.assertIs(template, _get_template(temp_dir.path, 'values.yaml.j2'))
+            self.assertIsInstance(
+                template.environment.bytecode_cache,
+                jinja2.FileSystemBytecodeCache
+            )
+            self.assertEqual(template.render({'num_replicas': 3}), '3')
+
+    @patch.object(ArgoCD, 'get_step_results', return_value=None)
+    @patch('tssc.step_implementers.deploy.argocd._get_template')
+    @patch('sh.git', create=True)
+    @patch('sh.argocd', create=True)
+    def test__update_values_yaml_relative_values_yaml_directory(
+        self,
+        argocd_mock,
+        git_mock,
+        get_template_mock,
+        get_step_results_mock
+    ):
+        git_mock.side_effect = \
+            TestStepImplementerDeployArgoCD.__create_git_rev_parse_side_effect(
+                abbreviated_ref='repo_branch'
+            )
+
+        argocd_step = self.__create_argocd_step_implementer(
+            argocd_mock=argocd_mock,
+            git_mock=git_mock,
+            step_config={
+                'organization' : 'org_name',
+                'application-name' : 'app_name',
+                'service-name' : 'srv_name',
+                'kube-app-domain' : 'apps.example.com',
+                'container-image-uri' : 'quay.io/tssc/myimage',
+                'values-yaml-directory' : 'templates'
+            }
+        )
+
+        with TempDirectory() as temp_dir:
+            original_cwd = os.getcwd()
+            os.chdir(temp_dir.path)
+            try:
+                expected_values_yaml_directory = os.path.join(os.getcwd(), 'templates')
+                argocd_step._update_values_yaml(temp_dir.path, 'values.yaml')
+            finally:
+                os.chdir(original_cwd)
+
+        get_template_mock.assert_called_once_with(
+            expected_values_yaml_directory,
+            'values.yaml.j2'
+        )
+
+    @patch.object(ArgoCD, 'get_step_results', return_value=None)
+    @patch('tssc.step_implementers.deploy.argocd.datetime')
+    @patch('sh.git', create=True)
+    @patch('sh.argocd', create=True)
+    def test__update_values_yaml_timestamp_stable_across_renders(
+        self,
+        argocd_mock,
+        git_mock,
+        datetime_mock,
+        get_step_results_mock
+    ):
+        git_mock.side_effect = \
+            TestStepImplementerDeployArgoCD.__create_git_rev_parse_side_effect(
+                abbreviated_ref='repo_branch'
+            )
+        datetime_mock.now.side_effect = [
+            datetime(2020, 1, 2, 3, 4, 5, 678, tzinfo=timezone.utc),
+            datetime(2020, 1, 2, 3, 4, 6, tzinfo=timezone.utc)
+        ]
+
+        with TempDirectory() as temp_dir:
+            temp_dir.write('values.yaml.j2', b'timestamp: {{ timestamp }}')
+
+            argocd_step = self.__create_argocd_step_implementer(
+                argocd_mock=argocd_mock,
+                git_mock=git_mock,
+                step_config={
+                    'organization' : 'org_name',
+                    'application-name' : 'app_name',
+                    'service-name' : 'srv_name',
+                    'kube-app-domain' : 'apps.example.com',
+                    'container-image-uri' : 'quay.io/tssc/myimage',
+                    'values-yaml-directory' : temp_dir.path
+                }
+            )
+
+            argocd_step._update_values_yaml(temp_dir.path, 'values-1.yaml')
+            argocd_step._update_values_yaml(temp_dir.path, 'values-2.yaml')
+
+            self.assertEqual(temp_dir.read('values-1.yaml'), b'timestamp: 2020-01-02T03:04:05Z')
+            self.assertEqual(temp_dir.read('values-2.yaml'), b'timestamp: 2020-01-02T03:04:05Z')
+            datetime_mock.now.assert_called_once_with(timezone.utc)
+
+    @patch('sh.git', create=True)
+    @patch('sh.argocd', create=True)
+    def test__get_app_name_memoized(self, argocd_mock, git_mock):
+        git_mock.side_effect = \
+            TestStepImplementerDeployArgoCD.__create_git_rev_parse_side_effect(
+                abbreviated_ref='repo_branch'
+            )
+
+        argocd_step = self.__create_argocd_step_implementer(
+            argocd_mock=argocd_mock,
+            git_mock=git_mock,
+            step_config={
+                'organization' : 'org_name',
+                'application-name' : 'app_name',
+                'service-name' : 'srv_name',
+                'kube-app-domain' : 'apps.example.com'
+            }
+        )
+
+        expected_app_name = 'org_name-app_name-srv_name-repo_branch'
+        self.assertEqual(argocd_step._get_app_name(), expected_app_name)
+        self.assertEqual(argocd_step._get_app_name(), expected_app_name)
+        self.assertEqual(
+            argocd_step._get_endpoint_url(),
+            f'srv_name.{expected_app_name}.apps.example.com'
+        )
+        self.assertEqual(argocd_step._get_repo_branch(), 'repo_branch')
+        git_mock.assert_called_once_with('rev-parse', '--abbrev-ref', 'HEAD')
+
+    def test__get_argocd_app_spec_app_missing(self):
+        argocd_app = MagicMock()
+        argocd_app.get.side_effect = sh.ErrorReturnCode_1('argocd', b'stdout', b'stderror')
+
+        self.assertIsNone(ArgoCD._get_argocd_app_spec(argocd_app, 'app-name'))
+
+    def test__get_argocd_app_spec_get_error(self):
+        argocd_app = MagicMock()
+        argocd_app.get.side_effect = sh.ErrorReturnCode_20('argocd', b'stdout', b'stderror')
+
+        with self.assertRaisesRegex(RuntimeError, r'Error getting ArgoCD app \(app-name\)'):
+            ArgoCD._get_argocd_app_spec(argocd_app, 'app-name')
+
+    def test__get_argocd_app_spec_invalid_json(self):
+        argocd_app = MagicMock()
+        argocd_app.get.return_value = 'not json'
+
+        self.assertIsNone(ArgoCD._get_argocd_app_spec(argocd_app, 'app-name'))
+
+    def test__get_argocd_app_spec_automated(self):
+        argocd_app = MagicMock()
+        argocd_app.get.return_value = json.dumps({
+            'spec': {
+                'source': {
+                    'repoURL': 'https://git.example.com/config.git',
+                    'targetRevision': 'main',
+                    'path': 'charts/app',
+                    'helm': {
+                        'valueFiles': ['values.yaml']
+                    }
+                },
+                'destination': {
+                    'server': 'https://kubernetes.default.svc',
+                    'namespace': 'app-name'
+                },
+                'syncPolicy': {
+                    'automated': {}
+                }
+            }
+        })
+
+        self.assertEqual(
+            ArgoCD._get_argocd_app_spec(argocd_app, 'app-name'),
+            {
+                'repoURL': 'https://git.example.com/config.git',
+                'targetRevision': 'main',
+                'path': 'charts/app',
+                'valueFiles': ['values.yaml'],
+                'server': 'https://kubernetes.default.svc',
+                'namespace': 'app-name',
+                'automated': True
+            }
+        )
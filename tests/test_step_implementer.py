@@ -3,6 +3,9 @@
 Tests the step implementer.
 """
 import os
+import stat
+import tempfile
+from unittest.mock import patch
 from testfixtures import TempDirectory
 
 import yaml
@@ -620,6 +623,248 @@ class TestStepImplementer(BaseTSSCTestCase):
                 'foo': "bar",
             })
 
+    def test_current_results_only_parsed_when_results_file_changes(self):
+        """Test current results only re-parses the results file when it changes"""
+        implementer = 'tests.helpers.sample_step_implementers.WriteConfigAsResultsStepImplementer'
+        config = Config({
+            'tssc-config': {
+                'write-config-as-results': {
+                    'implementer': implementer,
+                    'config': {
+                        'config-1': "config-1",
+                        'foo': "bar",
+                    }
+                },
+                'foo': {
+                    'implementer': 'tests.helpers.sample_step_implementers.FooStepImplementer',
+                    'config': {}
+                }
+            }
+        })
+        write_config_as_results_step_config_sub_step = (
+            config.get_step_config('write-config-as-results').get_sub_step(implementer)
+        )
+        foo_sub_step = (
+            config.get_step_config('foo')
+            .get_sub_step('tests.helpers.sample_step_implementers.FooStepImplementer')
+        )
+
+        with TempDirectory() as test_dir:
+            results_dir_path = os.path.join(test_dir.path, 'tssc-results')
+            write_config_step = WriteConfigAsResultsStepImplementer(
+                results_dir_path=results_dir_path,
+                results_file_name='tssc-results.yml',
+                work_dir_path='tssc-working',
+                config=write_config_as_results_step_config_sub_step
+            )
+            write_config_step.run_step()
+
+            foo_step = FooStepImplementer(
+                results_dir_path=results_dir_path,
+                results_file_name='tssc-results.yml',
+                work_dir_path='tssc-working',
+                config=foo_sub_step
+            )
+
+            with patch('tssc.step_implementer.yaml.load', wraps=yaml.load) as yaml_load_mock:
+                results = foo_step.get_step_results('write-config-as-results')
+                results['foo'] = 'modified by caller'
+                self.assertEqual(foo_step.get_step_results('write-config-as-results'), {
+                    'config-1': "config-1",
+                    'foo': "bar",
+                })
+                yaml_load_mock.assert_called_once()
+
+                # verify results written by another step implementer are picked up
+                write_config_step.write_results({'foo': 'baz'})
+                self.assertEqual(yaml_load_mock.call_count, 2)
+                self.assertEqual(foo_step.get_step_results('write-config-as-results'), {
+                    'config-1': "config-1",
+                    'foo': "baz",
+                })
+                self.assertEqual(yaml_load_mock.call_count, 3)
+
+    def test_write_results_unchanged_results_not_rewritten(self):
+        """Test writing results that do not change the results file does not rewrite it"""
+        implementer = 'tests.helpers.sample_step_implementers.WriteConfigAsResultsStepImplementer'
+        config = Config({
+            'tssc-config': {
+                'write-config-as-results': {
+                    'implementer': implementer,
+                    'config': {
+                        'config-1': "config-1",
+                        'foo': "bar",
+                    }
+                }
+            }
+        })
+        step_config = config.get_step_config('write-config-as-results')
+        sub_step = step_config.get_sub_step(implementer)
+
+        with TempDirectory() as test_dir:
+            results_dir_path = os.path.join(test_dir.path, 'tssc-results')
+            step = WriteConfigAsResultsStepImplementer(
+                results_dir_path=results_dir_path,
+                results_file_name='tssc-results.yml',
+                work_dir_path='tssc-working',
+                config=sub_step
+            )
+            step.run_step()
+
+            with patch(
+                'tssc.step_implementer.tempfile.mkstemp',
+                wraps=tempfile.mkstemp
+            ) as mkstemp_mock:
+                step.write_results({'foo': 'bar'})
+                step.write_results({})
+                mkstemp_mock.assert_not_called()
+
+                step.write_results({'foo': 'baz'})
+                mkstemp_mock.assert_called_once()
+
+            self.assertEqual(os.listdir(results_dir_path), ['tssc-results.yml'])
+            umask = os.umask(0)
+            os.umask(umask)
+            self.assertEqual(
+                stat.S_IMODE(os.stat(step.results_file_path).st_mode),
+                0o666 & ~umask
+            )
+
+            self.assertEqual(step.current_step_results(), {
+                'config-1': "config-1",
+                'foo': "baz",
+            })
+
+    def test_write_results_failed_write_cleaned_up(self):
+        """Test a failed write of the results file leaves the existing results file as is"""
+        implementer = 'tests.helpers.sample_step_implementers.WriteConfigAsResultsStepImplementer'
+        config = Config({
+            'tssc-config': {
+                'write-config-as-results': {
+                    'implementer': implementer,
+                    'config': {
+                        'config-1': "config-1",
+                        'foo': "bar",
+                    }
+                }
+            }
+        })
+        step_config = config.get_step_config('write-config-as-results')
+        sub_step = step_config.get_sub_step(implementer)
+
+        with TempDirectory() as test_dir:
+            results_dir_path = os.path.join(test_dir.path, 'tssc-results')
+            step = WriteConfigAsResultsStepImplementer(
+                results_dir_path=results_dir_path,
+                results_file_name='tssc-results.yml',
+                work_dir_path='tssc-working',
+                config=sub_step
+            )
+            step.run_step()
+
+            with patch('tssc.step_implementer.os.replace', side_effect=OSError('mock error')):
+                with self.assertRaisesRegex(OSError, 'mock error'):
+                    step.write_results({'foo': 'baz'})
+
+            self.assertEqual(os.listdir(results_dir_path), ['tssc-results.yml'])
+            with open(step.results_file_path, 'r') as step_results_file:
+                self.assertEqual(
+                    yaml.safe_load(step_results_file.read())['tssc-results']['write-config-as-results'],
+                    {
+                        'config-1': "config-1",
+                        'foo': "bar",
+                    }
+                )
+
+    def test_write_results_deleted_results_file_rewritten(self):
+        """Test writing unchanged results after the results file is deleted recreates it"""
+        implementer = 'tests.helpers.sample_step_implementers.WriteConfigAsResultsStepImplementer'
+        config = Config({
+            'tssc-config': {
+                'write-config-as-results': {
+                    'implementer': implementer,
+                    'config': {}
+                }
+            }
+        })
+        step_config = config.get_step_config('write-config-as-results')
+        sub_step = step_config.get_sub_step(implementer)
+
+        with TempDirectory() as test_dir:
+            results_dir_path = os.path.join(test_dir.path, 'tssc-results')
+            step = WriteConfigAsResultsStepImplementer(
+                results_dir_path=results_dir_path,
+                results_file_name='tssc-results.yml',
+                work_dir_path='tssc-working',
+                config=sub_step
+            )
+            step.write_results({'x': 1})
+            os.remove(step.results_file_path)
+
+            step.write_results({'x': 1})
+            self.assertTrue(os.path.exists(step.results_file_path))
+            self.assertEqual(step.current_step_results(), {'x': 1})
+
+    def test_write_results_keeps_existing_results_file_mode(self):
+        """Test rewriting the results file keeps the existing results file permissions"""
+        implementer = 'tests.helpers.sample_step_implementers.WriteConfigAsResultsStepImplementer'
+        config = Config({
+            'tssc-config': {
+                'write-config-as-results': {
+                    'implementer': implementer,
+                    'config': {}
+                }
+            }
+        })
+        step_config = config.get_step_config('write-config-as-results')
+        sub_step = step_config.get_sub_step(implementer)
+
+        with TempDirectory() as test_dir:
+            results_dir_path = os.path.join(test_dir.path, 'tssc-results')
+            step = WriteConfigAsResultsStepImplementer(
+                results_dir_path=results_dir_path,
+                results_file_name='tssc-results.yml',
+                work_dir_path='tssc-working',
+                config=sub_step
+            )
+            step.write_results({'x': 1})
+            os.chmod(step.results_file_path, 0o640)
+
+            with patch('tssc.step_implementer.os.umask', wraps=os.umask) as umask_mock:
+                step.write_results({'x': 2})
+                umask_mock.assert_not_called()
+
+            self.assertEqual(stat.S_IMODE(os.stat(step.results_file_path).st_mode), 0o640)
+            self.assertEqual(step.current_step_results(), {'x': 2})
+
+    def test_write_results_caller_modifies_written_results(self):
+        """Test modifying results after writing them does not change the step results"""
+        implementer = 'tests.helpers.sample_step_implementers.WriteConfigAsResultsStepImplementer'
+        config = Config({
+            'tssc-config': {
+                'write-config-as-results': {
+                    'implementer': implementer,
+                    'config': {}
+                }
+            }
+        })
+        step_config = config.get_step_config('write-config-as-results')
+        sub_step = step_config.get_sub_step(implementer)
+
+        with TempDirectory() as test_dir:
+            results_dir_path = os.path.join(test_dir.path, 'tssc-results')
+            step = WriteConfigAsResultsStepImplementer(
+                results_dir_path=results_dir_path,
+                results_file_name='tssc-results.yml',
+                work_dir_path='tssc-working',
+                config=sub_step
+            )
+            results = {'lst': [1]}
+            step.write_results(results)
+            results['lst'].append(2)
+
+            self.assertEqual(step.current_step_results(), {'lst': [1]})
+
     def test_current_step_results(self):
         """Test current step results"""
         implementer = 'tests.helpers.sample_step_implementers.WriteConfigAsResultsStepImplementer'
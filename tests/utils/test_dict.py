@@ -1,4 +1,5 @@
 import os
+import sys
 
 import unittest
 from testfixtures import TempDirectory
@@ -81,3 +82,21 @@ class TestDictUtils(BaseTSSCTestCase):
                 r"Conflict at tssc-config.step-foo.config.test1"):
 
             deep_merge(dict1, dict2)
+
+    def test_deep_merge_deeply_nested(self):
+        depth = sys.getrecursionlimit() + 100
+
+        dict1 = leaf1 = {}
+        dict2 = leaf2 = {}
+        for _ in range(depth):
+            leaf1['nested'] = {}
+            leaf1 = leaf1['nested']
+            leaf2['nested'] = {}
+            leaf2 = leaf2['nested']
+        leaf1['test1'] = 'foo'
+        leaf2['test2'] = 'bar'
+
+        result = deep_merge(dict1, dict2)
+
+        self.assertIs(result, dict1)
+        self.assertEqual(leaf1, {'test1': 'foo', 'test2': 'bar'})
@@ -28,6 +28,10 @@ class ConfigValue:
         List of path to the element that this is the value for.
     """
 
+    # NOTE: a ConfigValue is created for every leaf of every configuration source
+    #       so skip the per instance __dict__
+    __slots__ = ('__value', '__parent_source', '__path_parts')
+
     def __init__(self, value, parent_source=None, path_parts=None):
         self.__value = value
         self.__parent_source = parent_source
@@ -169,10 +173,11 @@ class ConfigValue:
         if path_parts is None:
             path_parts = []
 
+        convert_leaves_to_config_values = ConfigValue.convert_leaves_to_config_values
         if isinstance(values, dict): # pylint: disable=no-else-return
-            for child_key in values:
-                values[child_key] = ConfigValue.convert_leaves_to_config_values(
-                    values=values[child_key],
+            for child_key, child_value in values.items():
+                values[child_key] = convert_leaves_to_config_values(
+                    values=child_value,
                     parent_source=parent_source,
                     path_parts=(path_parts + [child_key])
                 )
@@ -180,7 +185,7 @@ class ConfigValue:
             return values
         elif isinstance(values, (list, tuple)):
             for child_key, child_value in enumerate(values):
-                values[child_key] = ConfigValue.convert_leaves_to_config_values(
+                values[child_key] = convert_leaves_to_config_values(
                     values=child_value,
                     parent_source=parent_source,
                     path_parts=(path_parts + [child_key])
@@ -222,14 +227,15 @@ class ConfigValue:
         --------
         ConfigValue.convert_leaves_to_config_values
         """
+        convert_leaves_to_values = ConfigValue.convert_leaves_to_values
         if isinstance(values, dict): # pylint: disable=no-else-return
-            for child_key in values:
-                values[child_key] = ConfigValue.convert_leaves_to_values(values[child_key])
+            for child_key, child_value in values.items():
+                values[child_key] = convert_leaves_to_values(child_value)
 
             return values
         elif isinstance(values, (list, tuple)):
             for child_key, child_value in enumerate(values):
-                values[child_key] = ConfigValue.convert_leaves_to_values(child_value)
+                values[child_key] = convert_leaves_to_values(child_value)
 
             return values
         elif isinstance(values, ConfigValue):
@@ -19,14 +19,14 @@ class StepConfig:
     ----------
     __parent_config : Config
     __step_name : str
-    __sub_steps : list of TSSCSubStepConfig
+    __sub_steps : dict of str to TSSCSubStepConfig
     __sub_step_config_overrides : dict
     """
 
     def __init__(self, parent_config, step_name):
         self.__parent_config = parent_config
         self.__step_name = step_name
-        self.__sub_steps = []
+        self.__sub_steps = {}
         self.__step_config_overrides = {}
 
     @property
@@ -56,7 +56,7 @@ class StepConfig:
         list of TSSCSubStepConfig
             Sub steps of this step.
         """
-        return self.__sub_steps
+        return list(self.__sub_steps.values())
 
     def get_sub_step(self, sub_step_name):
         """Get sub step of this step with a given name if one exists.
@@ -72,11 +72,7 @@ class StepConfig:
             Sub step of this step with the given name or
             None if no sub step with given name exists as part of this step.
         """
-        for sub_step in self.sub_steps:
-            if sub_step_name == sub_step.sub_step_name:
-                return sub_step
-
-        return None
+        return self.__sub_steps.get(sub_step_name)
 
     @property
     def step_config_overrides(self):
@@ -136,13 +132,8 @@ class StepConfig:
                 existing sub step environment configuration.
         """
 
-        existing_tssc_sub_step_config = None
-        for tssc_sub_step_config in self.sub_steps:
-            if tssc_sub_step_config.sub_step_name == sub_step_name:
-                existing_tssc_sub_step_config = tssc_sub_step_config
-                break
-
-        if existing_tssc_sub_step_config is None:
+        tssc_sub_step_config = self.__sub_steps.get(sub_step_name)
+        if tssc_sub_step_config is None:
             tssc_sub_step_config = SubStepConfig(
                 parent_step_config=self,
                 sub_step_name=sub_step_name,
@@ -150,7 +141,7 @@ class StepConfig:
                 sub_step_config=sub_step_config,
                 sub_step_env_config=sub_step_env_config
             )
-            self.sub_steps.append(tssc_sub_step_config)
+            self.__sub_steps[sub_step_name] = tssc_sub_step_config
         else:
             assert sub_step_implementer_name == tssc_sub_step_config.sub_step_implementer_name, \
                 f"Step ({self.step_name}) failed to update sub step ({sub_step_name})" + \
@@ -175,8 +175,8 @@ class SubStepConfig:
             Environment specific sub step configuration.
             Empty dict if no environment specific sub step configuration.
         """
-        if env in self.sub_step_env_config:
-            sub_step_env_config = self.sub_step_env_config[env]
+        if env in self.__sub_step_env_config:
+            sub_step_env_config = copy.deepcopy(self.__sub_step_env_config[env])
         else:
             sub_step_env_config = {}
 
@@ -274,15 +274,27 @@ class SubStepConfig:
             Value of the given configuration key or None if one does not exist
             for this sub step in the given context with the given defaults.
         """
-        runtime_step_config = self.__merge_runtime_step_config(environment, defaults)
-
-        if key in runtime_step_config:
-            if isinstance(runtime_step_config[key], ConfigValue):
-                value = runtime_step_config[key].value
-            else:
-                value = copy.deepcopy(runtime_step_config[key])
-        else:
-            value = None
+        # NOTE: rather then merging every configuration source just to look up one key
+        #       check the sources from highest to lowest precedence and stop at the first
+        #       one that has the key
+        config_sources = (
+            lambda: self.step_config_overrides,
+            lambda: self.get_sub_step_env_config(environment),
+            lambda: self.sub_step_config,
+            lambda: self.get_global_environment_defaults(environment),
+            lambda: self.global_defaults,
+            lambda: defaults if defaults else {}
+        )
+
+        value = None
+        for get_config_source in config_sources:
+            config_source = get_config_source()
+            if key in config_source:
+                if isinstance(config_source[key], ConfigValue):
+                    value = config_source[key].value
+                else:
+                    value = copy.deepcopy(config_source[key])
+                break
 
         return value
 
@@ -316,9 +328,11 @@ class SubStepConfig:
         dict
             A deep copy of the merged runtime step configuration
         """
-        defaults = defaults if defaults else {}
+        defaults = copy.deepcopy(defaults) if defaults else {}
 
-        return copy.deepcopy(self.__merge_runtime_step_config(environment, defaults))
+        # NOTE: every configuration source other then the given defaults is already a deep copy
+        #       so only the defaults need copying rather then deep copying the merged result
+        return self.__merge_runtime_step_config(environment, defaults)
 
     def __merge_runtime_step_config(self, environment=None, defaults=None):
         """Take all of the context about this sub step merges together a single dictionary
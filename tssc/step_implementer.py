@@ -1,9 +1,12 @@
 """Abstract class and helper constants for StepImplementer.
 """
 
+import copy
 import json
 import os
+import shutil
 import sys
+import tempfile
 import textwrap
 from abc import ABC, abstractmethod
 from contextlib import redirect_stderr, redirect_stdout
@@ -15,6 +18,13 @@ from tssc.config.config_value import ConfigValue
 from tssc.exceptions import TSSCException
 from tssc.utils.io import TextIOIndenter
 
+# NOTE: prefer the libyaml backed C implementations for reading and writing the results file
+#       and fall back to the pure python implementations if PyYAML was built without libyaml
+try:
+    from yaml import CSafeDumper as YamlSafeDumper, CSafeLoader as YamlSafeLoader
+except ImportError: # pragma: no cover
+    from yaml import SafeDumper as YamlSafeDumper, SafeLoader as YamlSafeLoader
+
 
 class DefaultSteps:  # pylint: disable=too-few-public-methods
     """
@@ -63,6 +73,10 @@ class StepImplementer(ABC): # pylint: disable=too-many-instance-attributes
     Attributes
     __config : SubStepConfig
     __environment : str
+    __current_results : dict
+        Last results parsed from or written to the results file.
+    __current_results_file_contents : str
+        Contents of the results file that __current_results was parsed from or written as.
     """
 
     __TSSC_RESULTS_KEY = 'tssc-results'
@@ -84,6 +98,8 @@ class StepImplementer(ABC): # pylint: disable=too-many-instance-attributes
         self.__environment = environment
 
         self.__results_file_path = None
+        self.__current_results = None
+        self.__current_results_file_contents = None
         super().__init__()
 
     @property
@@ -363,43 +379,41 @@ class StepImplementer(ABC): # pylint: disable=too-many-instance-attributes
             Existing results file has invalid yaml or existing results file does not have expected
             element.
         """
-        #If you are looking at this code you are going to need this:
-        # https://treyhunner.com/2018/10/asterisks-in-python-what-they-are-and-how-to-use-them/
         if results is not None:
-            current_results = self.current_results()
-            if current_results:
-                if current_results[StepImplementer.__TSSC_RESULTS_KEY].get(self.step_name):
-                    updated_step_results = {
-                        StepImplementer.__TSSC_RESULTS_KEY: {
-                            **current_results[StepImplementer.__TSSC_RESULTS_KEY],
-                            self.step_name: {
-                                **current_results \
-                                  [StepImplementer.__TSSC_RESULTS_KEY] \
-                                  [self.step_name], \
-                                  **results
-                            }
-                        }
-                    }
-                else:
-                    updated_step_results = {
-                        StepImplementer.__TSSC_RESULTS_KEY: {
-                            **current_results[StepImplementer.__TSSC_RESULTS_KEY],
-                            self.step_name: {
-                                **results
-                            }
-                        }
-                    }
-            else:
+            # NOTE: current_results hands back a freshly loaded results tree so merge this step's
+            #       results into it in place rather then rebuilding every step's results
+            updated_step_results = self.current_results()
+            if not updated_step_results:
                 updated_step_results = {
-                    StepImplementer.__TSSC_RESULTS_KEY: {
-                        self.step_name: {
-                            **results
-                        }
-                    }
+                    StepImplementer.__TSSC_RESULTS_KEY: {}
                 }
-            step_results_file_path = self.results_file_path
-            with open(step_results_file_path, 'w') as step_results_file:
-                yaml.dump(updated_step_results, step_results_file)
+
+            all_step_results = updated_step_results[StepImplementer.__TSSC_RESULTS_KEY]
+            step_results = all_step_results.get(self.step_name)
+            if step_results:
+                step_results.update(results)
+            else:
+                all_step_results[self.step_name] = dict(results)
+
+            updated_step_results_contents = yaml.dump(
+                updated_step_results,
+                Dumper=YamlSafeDumper
+            )
+            # NOTE: current_results just read the results file so if merging in this step's
+            #       results did not change anything there is no need to rewrite it
+            if updated_step_results_contents != self.__current_results_file_contents:
+                StepImplementer.__write_file_atomically(
+                    self.results_file_path,
+                    updated_step_results_contents
+                )
+
+            # NOTE: updated_step_results shares nested objects with the given results which the
+            #       caller may still modify so cache what was actually written instead
+            self.__current_results = yaml.load(
+                updated_step_results_contents,
+                Loader=YamlSafeLoader
+            )
+            self.__current_results_file_contents = updated_step_results_contents
 
     def current_results(self):
         """
@@ -418,16 +432,41 @@ class StepImplementer(ABC): # pylint: disable=too-many-instance-attributes
             Existing results file has invalid yaml or existing results file does not have expected
             element.
         """
-        if not os.path.exists(self.__results_dir_path):
-            os.makedirs(self.__results_dir_path)
+        # NOTE: callers are free to modify the returned results so hand back a copy
+        return copy.deepcopy(self.__get_current_results())
+
+    def __get_current_results(self):
+        """
+        Get the results of the TSSC so far, only re-parsing the results file if it has changed
+        since it was last parsed or written by this step implementer.
+
+        Returns
+        -------
+        dict
+            The results of the TSSC so far. This is the cached results, not a copy, so must not
+            be modified.
+
+        Raises
+        ------
+        TSSCException
+            Existing results file has invalid yaml or existing results file does not have expected
+            element.
+        """
+        os.makedirs(self.__results_dir_path, exist_ok=True)
 
         step_results_file_path = self.results_file_path
 
         current_results = None
         if os.path.exists(step_results_file_path):
             with open(step_results_file_path, 'r') as step_results_file:
+                current_results_file_contents = step_results_file.read()
+
+            if current_results_file_contents != self.__current_results_file_contents:
                 try:
-                    current_results = yaml.safe_load(step_results_file.read())
+                    current_results = yaml.load(
+                        current_results_file_contents,
+                        Loader=YamlSafeLoader
+                    )
                 except (yaml.scanner.ScannerError, yaml.parser.ParserError, ValueError) as err:
                     raise TSSCException(
                         'Existing results file'
@@ -435,16 +474,26 @@ class StepImplementer(ABC): # pylint: disable=too-many-instance-attributes
                         +' has invalid yaml: ' + str(err)
                     ) from err
 
-            if current_results:
-                if StepImplementer.__TSSC_RESULTS_KEY not in current_results:
-                    raise TSSCException(
-                        'Existing results file'
-                        +' (' + step_results_file_path + ')'
-                        +' does not have expected top level element'
-                        +' (' + StepImplementer.__TSSC_RESULTS_KEY + '): '
-                        + str(current_results)
-                    )
+                if current_results:
+                    if StepImplementer.__TSSC_RESULTS_KEY not in current_results:
+                        raise TSSCException(
+                            'Existing results file'
+                            +' (' + step_results_file_path + ')'
+                            +' does not have expected top level element'
+                            +' (' + StepImplementer.__TSSC_RESULTS_KEY + '): '
+                            + str(current_results)
+                        )
+
+                self.__current_results = current_results
+                self.__current_results_file_contents = current_results_file_contents
+
+            current_results = self.__current_results
         else:
+            # NOTE: the results file has gone away so forget the last read or written contents,
+            #       otherwise the next write_results could think the file is up to date
+            self.__current_results = None
+            self.__current_results_file_contents = None
+
             current_results = {
                 StepImplementer.__TSSC_RESULTS_KEY: {
                     self.step_name: {}
@@ -557,7 +606,10 @@ class StepImplementer(ABC): # pylint: disable=too-many-instance-attributes
         dict
             The results of a specific step. None if results DNE
         """
-        return self.current_results()[StepImplementer.__TSSC_RESULTS_KEY].get(step_name)
+        # NOTE: only copy the requested step's results rather then all of the results
+        return copy.deepcopy(
+            self.__get_current_results()[StepImplementer.__TSSC_RESULTS_KEY].get(step_name)
+        )
 
     def current_step_results(self):
         """
@@ -585,11 +637,8 @@ class StepImplementer(ABC): # pylint: disable=too-many-instance-attributes
         str
             return a string to the absolute path
         """
-        if not os.path.exists(self.__work_dir_path):
-            os.makedirs(self.__work_dir_path)
         step_path = os.path.join(self.__work_dir_path, self.step_name)
-        if not os.path.exists(step_path):
-            os.makedirs(step_path)
+        os.makedirs(step_path, exist_ok=True)
 
         return os.path.abspath(step_path)
 
@@ -646,6 +695,44 @@ class StepImplementer(ABC): # pylint: disable=too-many-instance-attributes
 
         return file_path
 
+    @staticmethod
+    def __write_file_atomically(file_path, contents):
+        """Writes the given contents to a uniquely named temporary file next to the given file
+        and then moves it into place, so anything reading the file, including another writer,
+        never sees a partially written file.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the file to write.
+        contents : str
+            Contents to write to the file.
+        """
+        tmp_file_fd, tmp_file_path = tempfile.mkstemp(
+            dir=os.path.dirname(file_path),
+            prefix=os.path.basename(file_path) + '.',
+            suffix='.tmp'
+        )
+        try:
+            with os.fdopen(tmp_file_fd, 'w') as tmp_file:
+                tmp_file.write(contents)
+
+            # NOTE: mkstemp creates the file readable only by the owner, so keep the permissions
+            #       of the file being replaced, or if there is none, give it the permissions open()
+            #       would have. Reading the umask means briefly setting it for the whole process
+            #       so only do that when first creating the file.
+            if os.path.exists(file_path):
+                shutil.copymode(file_path, tmp_file_path)
+            else:
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(tmp_file_path, 0o666 & ~umask)
+
+            os.replace(tmp_file_path, file_path)
+        finally:
+            if os.path.exists(tmp_file_path):
+                os.remove(tmp_file_path)
+
     @staticmethod
     def __print_section_title(title, div_char="=", indent=0):
         """
@@ -108,15 +108,18 @@ Elements in `report-artifacts` dictionary:
         }
     }
 """
+import functools
+import json
 import os
 import re
-import shutil
 import sys
 import tempfile
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 
 import sh
-from jinja2 import Environment, FileSystemLoader
+import yaml
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from tssc import DefaultSteps, StepImplementer
 from tssc.config import ConfigValue
 
@@ -144,14 +147,93 @@ GIT_AUTHENTICATION_CONFIG = {
     'git-password': None
 }
 
-KUBE_LABEL_NOT_SAFE_CHARS_REGEX = r"[^a-zA-Z0-9\-_\.]"
-KUBE_LABEL_NOT_SAFE_BEGINING_END_CHARS_REGEX = r"^[^a-zA-Z0-9]*|[^a-zA-Z0-9]*$"
+GIT_CREDENTIAL_HELPER_CONFIG = 'credential.helper=' \
+    '!f() { echo "username=${TSSC_GIT_USERNAME}"; echo "password=${TSSC_GIT_PASSWORD}"; }; f'
+
+KUBE_LABEL_NOT_SAFE_CHARS_RE = re.compile(r"[^a-zA-Z0-9\-_\.]")
+# NOTE: once KUBE_LABEL_NOT_SAFE_CHARS_RE has been applied these are the only
+#       non alphanumeric chars left that a kube label can not start or end with
+KUBE_LABEL_NOT_SAFE_EDGE_CHARS = '-_.'
 KUBE_LABEL_MAX_LENGTH = 52
 KUBE_LABEL_REPLACEMENT_CHAR = '-'
 
+@functools.lru_cache(maxsize=None)
+def _get_template(values_yaml_directory, values_yaml_template):
+    """Gets the compiled jinja template for the values yaml file.
+
+    The jinja Environment and compiled Template are cached so that repeated deploys within the
+    same process (e.g. one per environment) do not re-parse the template, and the compiled
+    template bytecode is cached on disk so that new processes do not have to either.
+
+    Parameters
+    ----------
+    values_yaml_directory : str
+        Directory containing the jinja templates.
+    values_yaml_template : str
+        Name of the values yaml jinja template in the given directory.
+
+    Returns
+    -------
+    jinja2.Template
+        Compiled values yaml jinja template.
+    """
+    env = Environment(
+        loader=FileSystemLoader(values_yaml_directory),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+        cache_size=400,
+        # NOTE: with no directory given jinja uses a private per user directory under the
+        #       system temp directory. Cache entries are keyed on a checksum of the template
+        #       source so a changed template is never served stale bytecode.
+        bytecode_cache=FileSystemBytecodeCache()
+    )
+
+    return env.get_template(values_yaml_template)
+
+@functools.lru_cache(maxsize=None)
+def _get_run_timestamp():
+    """Gets the timestamp of this run to render into the values yaml file.
+
+    The timestamp is only computed once per process so that deploying to multiple environments
+    in the same run renders the same timestamp rather then introducing needless differences.
+
+    Returns
+    -------
+    str
+        ISO 8601 UTC timestamp, to the second, of the first time this was called.
+    """
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
 class ArgoCD(StepImplementer):
     """ StepImplementer for the deploy step for ArgoCD.
     """
+    def __init__( # pylint: disable=too-many-arguments
+            self,
+            results_dir_path,
+            results_file_name,
+            work_dir_path,
+            config,
+            environment=None):
+
+        # NOTE: these values are invariant for the life of a single step run and are used
+        #       repeatedly, so they are only computed once. Notably _get_repo_branch shells out
+        #       to git every time it is computed.
+        self.__repo_branch = None
+        self.__app_name = None
+        self.__endpoint_url = None
+        self.__image_version = None
+        self.__config_repo_git_tag = None
+        self.__jinja_runtime_step_config = None
+
+        super().__init__(
+            results_dir_path=results_dir_path,
+            results_file_name=results_file_name,
+            work_dir_path=work_dir_path,
+            config=config,
+            environment=environment
+        )
+
     @staticmethod
     def step_implementer_config_defaults():
         """
@@ -231,46 +313,7 @@ class ArgoCD(StepImplementer):
         # If the cluster is an external cluster and an api token was provided,
         # add the cluster to ArgoCD
         if  kube_api != DEFAULT_CONFIG['kube-api-uri']:
-            context_name = f'{kube_api}-context'
-            kubeconfig = """
-current-context: {context}
-apiVersion: v1
-clusters:
-- cluster:
-    insecure-skip-tls-verify: {skip_tls}
-    server: {kube_api}
-  name: default-cluster
-
-contexts:
-- context:
-    cluster: default-cluster
-    user: default-user
-  name: {context}
-
-kind: Config
-preferences:
-users:
-- name: default-user
-  user:
-    token: {kube_token}
-            """.format(context=context_name,
-                       kube_api=kube_api,
-                       kube_token=self.get_config_value('kube-api-token'),
-                       skip_tls=str(self.get_config_value('insecure-skip-tls-verify').lower()))
-
-            with tempfile.NamedTemporaryFile(buffering=0) as temp_file:
-                temp_file.write(bytes(kubeconfig, 'utf-8'))
-                try:
-                    sh.argocd.cluster.add( # pylint: disable=no-member
-                        '--kubeconfig',
-                        temp_file.name,
-                        context_name,
-                        _out=sys.stdout,
-                        _err=sys.stderr
-                    )
-                except sh.ErrorReturnCode as error:
-                    raise RuntimeError("Error adding cluster to ArgoCD: {cluster}".format(
-                        cluster=kube_api)) from error
+            self._argocd_add_target_cluster(kube_api)
 
         helm_chart_path = self.get_config_value('argocd-helm-chart-path')
         values_file_name = f'values-{self.environment}.yaml' if self.environment else 'values.yaml'
@@ -289,133 +332,128 @@ users:
 
             git_url = self.get_config_value('helm-config-repo')
             repo_branch = self._get_repo_branch()
+            git = sh.git.bake( # pylint: disable=no-member
+                _cwd=repo_directory,
+                _out=sys.stdout,
+                _err=sys.stderr
+            )
 
             try:
-                sh.git.clone(
+                config_repo_has_branch = ArgoCD._clone_config_repo(
+                    git,
                     git_url,
-                    repo_directory,
-                    _out=sys.stdout,
-                    _err=sys.stderr
+                    repo_branch,
+                    repo_directory
                 )
 
-                try:
-                    sh.git.checkout(
-                        repo_branch,
-                        _cwd=repo_directory,
-                        _out=sys.stdout,
-                        _err=sys.stderr
-                    )
-
-                except sh.ErrorReturnCode:
-                    sh.git.checkout(
-                        '-b',
-                        repo_branch,
-                        _cwd=repo_directory,
-                        _out=sys.stdout,
-                        _err=sys.stderr
-                    )
-
                 self._update_values_yaml(repo_directory, values_file_repo_relative_path)
 
                 git_commit_msg = 'Configuration Change from TSSC Pipeline. Repository: ' +\
                                  '{repo}'.format(repo=git_url)
 
-                sh.git.config(
-                    '--global',
-                    'user.email',
-                    self.get_config_value('git-email'),
-                    _out=sys.stdout,
-                    _err=sys.stderr
-                )
+                git.add(values_file_repo_relative_path)
+
+                # NOTE: if the rendered values file is the same as what is already in the config
+                #       repo then there is nothing to commit
+                values_file_changed = ArgoCD._git_has_staged_changes(git)
+                if values_file_changed:
+                    # NOTE: set the commit identity via the environment rather then with
+                    #       `git config --global` so as to not fork extra git processes or
+                    #       modify the user's global git configuration
+                    git_email = self.get_config_value('git-email')
+                    git_name = self.get_config_value('git-friendly-name')
+                    git.commit(
+                        '-am',
+                        git_commit_msg,
+                        _env={
+                            **os.environ,
+                            'GIT_AUTHOR_EMAIL': git_email,
+                            'GIT_AUTHOR_NAME': git_name,
+                            'GIT_COMMITTER_EMAIL': git_email,
+                            'GIT_COMMITTER_NAME': git_name
+                        }
+                    )
+                else:
+                    print(f'No changes to {values_file_repo_relative_path}, skipping commit')
 
-                sh.git.config(
-                    '--global',
-                    'user.name',
-                    self.get_config_value('git-friendly-name'),
-                    _out=sys.stdout,
-                    _err=sys.stderr
-                )
+            except sh.ErrorReturnCode as error: # pylint: disable=undefined-variable
+                raise RuntimeError("Error invoking git: {all}".format(all=error)) from error
 
-                sh.git.add(
-                    values_file_repo_relative_path,
-                    _cwd=repo_directory,
-                    _out=sys.stdout,
-                    _err=sys.stderr
-                )
+            argocd_app_name = self._get_app_name()
+            argocd_app = sh.argocd.app.bake( # pylint: disable=no-member
+                _out=sys.stdout,
+                _err=sys.stderr
+            )
 
-                sh.git.commit(
-                    '-am',
-                    git_commit_msg,
-                    _cwd=repo_directory,
-                    _out=sys.stdout,
-                    _err=sys.stderr
+            # NOTE: pushing to the config repo and getting the existing argocd app talk to
+            #       different servers and do not depend on each other so do them concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                existing_argocd_app_spec_future = executor.submit(
+                    ArgoCD._get_argocd_app_spec,
+                    argocd_app,
+                    argocd_app_name
                 )
 
-                sh.git.status(
-                    _cwd=repo_directory,
-                    _out=sys.stdout,
-                    _err=sys.stderr
+                # NOTE: the branch still has to be pushed if it was only created locally,
+                #       and the tag is always created and pushed since it is reported in the
+                #       results even if there was nothing new to commit
+                git_tag_and_push_future = executor.submit(
+                    self._git_tag_and_push,
+                    repo_directory,
+                    values_file_changed or not config_repo_has_branch
                 )
 
-            except sh.ErrorReturnCode as error: # pylint: disable=undefined-variable
-                raise RuntimeError("Error invoking git: {all}".format(all=error)) from error
-
-            self._git_tag_and_push(repo_directory)
-
-            argocd_app_name = self._get_app_name()
+                git_tag_and_push_future.result()
+                existing_argocd_app_spec = existing_argocd_app_spec_future.result()
+
+            auto_sync = str(self.get_config_value('argocd-auto-sync')).lower() == 'true'
+            argocd_app_spec = {
+                'repoURL': git_url,
+                'targetRevision': repo_branch,
+                'path': helm_chart_path,
+                'valueFiles': [values_file_name],
+                'server': self.get_config_value('kube-api-uri'),
+                'namespace': argocd_app_name,
+                'automated': auto_sync
+            }
 
-            try:
-                sh.argocd.app.get( # pylint: disable=no-member
+            # NOTE: only create / update the app if it does not already exist as wanted
+            if existing_argocd_app_spec != argocd_app_spec:
+                argocd_app.create(
                     argocd_app_name,
-                    _out=sys.stdout,
-                    _err=sys.stderr
+                    '--upsert',
+                    '--repo=' + git_url,
+                    '--revision=' + repo_branch,
+                    '--path=' + helm_chart_path,
+                    '--dest-server=' + self.get_config_value('kube-api-uri'),
+                    '--dest-namespace=' + argocd_app_name,
+                    '--sync-policy=' + ('automated' if auto_sync else 'none'),
+                    '--values=' + values_file_name
                 )
-            except sh.ErrorReturnCode_1:  # pylint: disable=undefined-variable, no-member
-                print('No app found, creating a new app...')
-
-            sync_policy = 'automated' if str(
-                self.get_config_value('argocd-auto-sync')).lower() == 'true' else 'none'
-
-            sh.argocd.app.create( # pylint: disable=no-member
-                argocd_app_name,
-                '--repo=' + git_url,
-                '--revision=' + repo_branch,
-                '--path=' + helm_chart_path,
-                '--dest-server=' + self.get_config_value('kube-api-uri'),
-                '--dest-namespace=' + argocd_app_name,
-                '--sync-policy=' + sync_policy,
-                '--values=' + values_file_name,
-                _out=sys.stdout,
-                _err=sys.stderr
-            )
+            else:
+                print(f'ArgoCD app ({argocd_app_name}) already exists as wanted, skipping create')
 
-            sh.argocd.app.sync( # pylint: disable=no-member
+            argocd_app.sync(
                 '--timeout',
                 self.get_config_value('argocd-sync-timeout-seconds'),
-                argocd_app_name,
-                _out=sys.stdout,
-                _err=sys.stderr
+                argocd_app_name
             )
 
-            sh.argocd.app.wait( # pylint: disable=no-member
+            argocd_app.wait(
                 '--timeout',
                 self.get_config_value('argocd-sync-timeout-seconds'),
                 '--health',
-                argocd_app_name,
-                _out=sys.stdout,
-                _err=sys.stderr
+                argocd_app_name
             )
 
             # NOTE: Creating a file to pass to the next step
-            manifest_file = self.write_working_file(
-                'deploy_argocd_manifests.yml',
-                b''
-            )
+            #       argocd writes the manifests straight to this path so there is no need to
+            #       create it empty first
+            manifest_file = os.path.join(self.get_working_dir(), 'deploy_argocd_manifests.yml')
 
-            sh.argocd.app.manifests( # pylint: disable=no-member
+            argocd_app.manifests(
                 argocd_app_name,
-                _out=manifest_file,
-                _err=sys.stderr
+                _out=manifest_file
             )
 
             results = {
@@ -436,6 +474,114 @@ users:
 
         return results
 
+    def _argocd_add_target_cluster(self, kube_api):
+        """Adds an external k8s cluster to ArgoCD as a deployment target.
+
+        Parameters
+        ----------
+        kube_api : str
+            API endpoint of the external k8s cluster to add.
+
+        Raises
+        ------
+        RuntimeError
+            If the cluster could not be added to ArgoCD.
+        """
+        context_name = f'{kube_api}-context'
+        kubeconfig = yaml.safe_dump({
+            'current-context': context_name,
+            'apiVersion': 'v1',
+            'clusters': [{
+                'cluster': {
+                    'insecure-skip-tls-verify': str(
+                        self.get_config_value('insecure-skip-tls-verify')
+                    ).lower() == 'true',
+                    'server': kube_api
+                },
+                'name': 'default-cluster'
+            }],
+            'contexts': [{
+                'context': {
+                    'cluster': 'default-cluster',
+                    'user': 'default-user'
+                },
+                'name': context_name
+            }],
+            'kind': 'Config',
+            'preferences': {},
+            'users': [{
+                'name': 'default-user',
+                'user': {
+                    'token': self.get_config_value('kube-api-token')
+                }
+            }]
+        })
+
+        # NOTE: argocd may read the given kubeconfig more then once so it has to be a real
+        #       file rather then piped in via stdin
+        with tempfile.NamedTemporaryFile(buffering=0) as temp_file:
+            temp_file.write(kubeconfig.encode())
+            try:
+                sh.argocd.cluster.add( # pylint: disable=no-member
+                    '--kubeconfig',
+                    temp_file.name,
+                    context_name,
+                    _out=sys.stdout,
+                    _err=sys.stderr
+                )
+            except sh.ErrorReturnCode as error:
+                raise RuntimeError("Error adding cluster to ArgoCD: {cluster}".format(
+                    cluster=kube_api)) from error
+
+    @staticmethod
+    def _clone_config_repo(git, git_url, repo_branch, repo_directory):
+        """Shallow clones the config repo and checks out the given branch, creating it locally
+        if it does not already exist in the config repo.
+
+        Parameters
+        ----------
+        git : sh.Command
+            `git` command baked to run in the given repo directory.
+        git_url : str
+            URL of the remote config repo.
+        repo_branch : str
+            Name of the branch to check out.
+        repo_directory : str
+            Directory to clone the config repo to.
+
+        Returns
+        -------
+        bool
+            True if the branch already existed in the remote config repo,
+            False if it was only created locally.
+        """
+        # NOTE: only the tip of a single branch is needed to update the values file and
+        #       push a new commit, so do a shallow clone rather then fetching full history
+        config_repo_has_branch = ArgoCD._config_repo_has_branch(git_url, repo_branch)
+        if config_repo_has_branch:
+            sh.git.clone(
+                git_url,
+                repo_directory,
+                '--depth=1',
+                '--single-branch',
+                '--branch=' + repo_branch,
+                _out=sys.stdout,
+                _err=sys.stderr
+            )
+        else:
+            sh.git.clone(
+                git_url,
+                repo_directory,
+                '--depth=1',
+                '--single-branch',
+                _out=sys.stdout,
+                _err=sys.stderr
+            )
+
+            git.checkout('-b', repo_branch)
+
+        return config_repo_has_branch
+
     def __get_container_image_uri(self):
         """Get the container image repository uri.
 
@@ -457,7 +603,88 @@ users:
 
         return container_image_repository_uri
 
+    @staticmethod
+    def _git_has_staged_changes(git):
+        """Determines if there are any staged changes to commit.
+
+        Parameters
+        ----------
+        git : sh.Command
+            `git` command baked with the repository to check.
+
+        Returns
+        -------
+        bool
+            True if there are staged changes, False otherwise.
+        """
+        # NOTE: only the exit code is of interest, so send stdout straight to devnull
+        #       rather then having sh pump it through sys.stdout
+        try:
+            git.diff('--cached', '--quiet', _out=os.devnull)
+            return False
+        except sh.ErrorReturnCode_1: # pylint: disable=no-member
+            return True
+
+    @staticmethod
+    def _get_argocd_app_spec(argocd_app, argocd_app_name):
+        """Gets the relevant parts of the spec of an existing argocd app.
+
+        Parameters
+        ----------
+        argocd_app : sh.Command
+            `argocd app` command to run the `get` with.
+        argocd_app_name : str
+            Name of the argocd app to get the spec of.
+
+        Returns
+        -------
+        dict or None
+            The repoURL, targetRevision, path, valueFiles, server, namespace, and whether
+            sync is automated for the existing app,
+            or None if the app does not exist or its spec could not be determined.
+
+        Raises
+        ------
+        RuntimeError
+            If getting the argocd app fails for any reason other then the app not existing.
+        """
+        try:
+            argocd_app_json = json.loads(str(argocd_app.get(
+                argocd_app_name,
+                '--output=json',
+                _out=None
+            )))
+        except sh.ErrorReturnCode_1: # pylint: disable=no-member
+            print('No app found, creating a new app...')
+            return None
+        except sh.ErrorReturnCode as error:
+            raise RuntimeError(
+                "Error getting ArgoCD app ({app}): {all}".format(app=argocd_app_name, all=error)
+            ) from error
+        except ValueError as error:
+            print(
+                f'Could not parse existing ArgoCD app ({argocd_app_name}) spec,'
+                f' creating / updating the app: {error}'
+            )
+            return None
+
+        spec = argocd_app_json.get('spec') or {}
+        source = spec.get('source') or {}
+        destination = spec.get('destination') or {}
+        return {
+            'repoURL': source.get('repoURL'),
+            'targetRevision': source.get('targetRevision'),
+            'path': source.get('path'),
+            'valueFiles': (source.get('helm') or {}).get('valueFiles'),
+            'server': destination.get('server'),
+            'namespace': destination.get('namespace'),
+            'automated': (spec.get('syncPolicy') or {}).get('automated') is not None
+        }
+
     def _get_image_version(self):
+        if self.__image_version is not None:
+            return self.__image_version
+
         image_version = 'latest'
 
         if self.get_config_value('container-image-version'):
@@ -470,67 +697,102 @@ users:
                 image_version = push_container_image_results.get('container-image-version')
             else:
                 print('No image version found in metadata, using \"latest\"')
+
+        self.__image_version = image_version
         return image_version
 
-    def _update_values_yaml(self, repo_directory, values_file_repo_relative_path): # pylint: disable=too-many-locals
-        env = Environment(
-            loader=FileSystemLoader(self.get_config_value('values-yaml-directory')),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+    def _get_jinja_runtime_step_config(self):
+        """Gets the runtime step configuration as jinja template variables.
+
+        Notes
+        -----
+        The runtime step configuration is invariant for a single step run so this is only
+        computed once.
+
+        Returns
+        -------
+        dict
+            Runtime step configuration values keyed by the configuration key with all `-`
+            replaced with `_` so as to be valid jinja variable names.
+        """
+        if self.__jinja_runtime_step_config is None:
+            self.__jinja_runtime_step_config = {
+                key.replace('-', '_'): value for key, value in \
+                    ConfigValue.convert_leaves_to_values(
+                        self.get_copy_of_runtime_step_config()
+                    ).items()
+            }
+        return self.__jinja_runtime_step_config
 
+    def _update_values_yaml(self, repo_directory, values_file_repo_relative_path): # pylint: disable=too-many-locals
         argocd_app_name = self._get_app_name()
         version = self._get_image_version()
         container_image_uri = self.__get_container_image_uri()
-        timestamp = str(datetime.now())
+        timestamp = _get_run_timestamp()
         repo_branch = self._get_repo_branch()
         endpoint_url = self._get_endpoint_url()
+        # NOTE: runtime step configuration takes precedence over the computed values
         jinja_runtime_step_config = {'container_image_uri' : container_image_uri,
                                      'image_version' : version,
                                      'timestamp' : timestamp,
                                      'repo_branch' : repo_branch,
                                      'deployment_namespace' : argocd_app_name,
-                                     'endpoint_url' : endpoint_url}
-
-        copy_of_runtime_step_config = ConfigValue.convert_leaves_to_values(
-            self.get_copy_of_runtime_step_config()
-        )
-        for key in copy_of_runtime_step_config:
-            jinja_runtime_step_config[key.replace('-', '_')] = copy_of_runtime_step_config[key]
-
-        template = env.get_template(self.get_config_value('values-yaml-template'))
-
-        rendered_values_file = self.write_working_file(
-            'values.yml',
-            bytes(template.render(jinja_runtime_step_config), 'utf-8')
+                                     'endpoint_url' : endpoint_url,
+                                     **self._get_jinja_runtime_step_config()}
+
+        # NOTE: the template is cached by directory, so use the absolute path so that a relative
+        #       directory is not resolved against whatever the working directory was first time
+        template = _get_template(
+            os.path.abspath(self.get_config_value('values-yaml-directory')),
+            self.get_config_value('values-yaml-template')
         )
 
+        # NOTE: render straight into the config repo rather then rendering to a working file
+        #       and then copying that into the config repo
         try:
-            shutil.copyfile(
-                rendered_values_file,
-                os.path.join(repo_directory, values_file_repo_relative_path)
+            template.stream(jinja_runtime_step_config).dump(
+                os.path.join(repo_directory, values_file_repo_relative_path),
+                encoding='utf-8'
             )
-        except (shutil.SameFileError, OSError, IOError) as error:
-            raise RuntimeError("Error copying {values_file} file: {all}".format(
+        except (OSError, IOError) as error:
+            raise RuntimeError("Error writing {values_file} file: {all}".format(
                 values_file=values_file_repo_relative_path, all=error)) from error
 
     def _get_tag(self, repo_directory):
-        """TODO: doc me
+        """Gets the tag to apply to the config repo.
+
+        Notes
+        -----
+        The tag is only computed once per step run since the config repo HEAD is not changed
+        after it is committed to and tagged.
+
+        Parameters
+        ----------
+        repo_directory : str
+            Directory the config repo is checked out to.
+
+        Returns
+        -------
+        str
+            Tag made up of the tag-source step tag and the short hash of the config repo HEAD.
         """
+        if self.__config_repo_git_tag is not None:
+            return self.__config_repo_git_tag
+
         tag = 'latest'
-        if(self.get_step_results(DefaultSteps.TAG_SOURCE) \
-          and self.get_step_results(DefaultSteps.TAG_SOURCE).get('tag')):
-            tag = self.get_step_results(DefaultSteps.TAG_SOURCE).get('tag')
+        tag_source_results = self.get_step_results(DefaultSteps.TAG_SOURCE)
+        if tag_source_results and tag_source_results.get('tag'):
+            tag = tag_source_results.get('tag')
         else:
             print('No version found in metadata. Using latest')
 
         commit_tag = sh.git('rev-parse', '--short', 'HEAD', _cwd=repo_directory).rstrip() # pylint: disable=too-many-function-args, unexpected-keyword-arg
 
-        full_tag = "{tag}.{commit_tag}".format(tag=tag, commit_tag=commit_tag)
+        self.__config_repo_git_tag = "{tag}.{commit_tag}".format(tag=tag, commit_tag=commit_tag)
 
-        return full_tag
+        return self.__config_repo_git_tag
 
-    def _git_tag_and_push(self, repo_directory):
+    def _git_tag_and_push(self, repo_directory, push_branch=True):
         username = None
         password = None
 
@@ -547,43 +809,47 @@ users:
         else:
             print('No username/password found, assuming ssh')
         git_url = self.get_config_value('helm-config-repo')
-        if git_url.startswith('http://'):
-            if username and password:
-                self._git_push(repo_directory,
-                               'http://{username}:{password}@{url}'.format(
-                                   username=username,
-                                   password=password,
-                                   url=git_url[7:]))
-            else:
+        if git_url.startswith(('http://', 'https://')):
+            if not (username and password):
                 raise ValueError(
-                    'For a http:// git url, you need to also provide ' \
-                    'username/password pair'
+                    'For a {scheme}:// git url, you need to also provide ' \
+                    'username/password pair'.format(scheme=git_url.split('://', 1)[0])
                 )
-        elif git_url.startswith('https://'):
-            if username and password:
-                self._git_push(repo_directory,
-                               'http://{username}:{password}@{url}'.format(
-                                   username=username,
-                                   password=password,
-                                   url=git_url[8:]))
 
-            else:
-                raise ValueError(
-                    'For a https:// git url, you need to also provide ' \
-                    'username/password pair'
-                )
+            # NOTE: the credentials are handed to git via a credential helper reading them
+            #       from the environment so that they never end up in the process arguments
+            #       or in the pushed to url
+            #
+            # NOTE: git uses the first configured helper that returns credentials, so first
+            #       reset the helper list with an empty value so that any system or global
+            #       helpers (store, cache, keychain) can not win with stale credentials
+            git_push = sh.git.bake( # pylint: disable=no-member
+                '-c',
+                'credential.helper=',
+                '-c',
+                GIT_CREDENTIAL_HELPER_CONFIG,
+                _env={
+                    **os.environ,
+                    'TSSC_GIT_USERNAME': username,
+                    'TSSC_GIT_PASSWORD': password
+                }
+            ).push.bake(git_url)
+            self._git_push(repo_directory, git_push, push_branch)
         else:
-            self._git_push(repo_directory, None)
+            self._git_push(repo_directory, push_branch=push_branch)
 
-    def _git_push(self, repo_directory, url=None):
+    def _git_push(self, repo_directory, git_push=None, push_branch=True):
 
-        git_push = sh.git.push.bake(url) if url else sh.git.push
+        git_push = git_push or sh.git.push
 
         try:
-            git_push(
-                _out=sys.stdout,
-                _cwd=repo_directory
-            )
+            if push_branch:
+                git_push(
+                    _out=sys.stdout,
+                    _cwd=repo_directory
+                )
+            else:
+                print('Config repo branch is already up to date, only pushing tag')
 
             tag = self._get_tag(repo_directory)
             self._git_tag(repo_directory, tag)
@@ -617,6 +883,9 @@ users:
             raise RuntimeError('Error invoking git tag ' + git_tag_value) from error
 
     def _get_app_name(self):
+        if self.__app_name is not None:
+            return self.__app_name
+
         repo_branch = self._get_repo_branch()
         organization = self.get_config_value('organization')
         application = self.get_config_value('application-name')
@@ -628,34 +897,56 @@ users:
 
         # repalce dangerous characters in app name
         app_name = app_name.lower()
-        app_name = re.sub(
-            KUBE_LABEL_NOT_SAFE_CHARS_REGEX,
-            KUBE_LABEL_REPLACEMENT_CHAR,
-            app_name
-        )
+        app_name = KUBE_LABEL_NOT_SAFE_CHARS_RE.sub(KUBE_LABEL_REPLACEMENT_CHAR, app_name)
 
         # max length for a kube label / resource name is 63
-        if len(app_name) > KUBE_LABEL_MAX_LENGTH:
-            app_name = app_name[len(app_name)-KUBE_LABEL_MAX_LENGTH:]
+        app_name = app_name[-KUBE_LABEL_MAX_LENGTH:]
 
         # be sure app name doesn't start or end with not safe chars
-        app_name = re.sub(
-            KUBE_LABEL_NOT_SAFE_BEGINING_END_CHARS_REGEX,
-            '',
-            app_name
-        )
+        app_name = app_name.strip(KUBE_LABEL_NOT_SAFE_EDGE_CHARS)
 
+        self.__app_name = app_name
         return app_name
 
     def _get_endpoint_url(self):
-        argocd_app_name = self._get_app_name()
-        endpoint_url = "{service}.{namespace}.{domain}".format(
-            service=self.get_config_value('service-name'),
-            namespace=argocd_app_name,
-            domain=self.get_config_value('kube-app-domain')
-        )
-        return endpoint_url
+        if self.__endpoint_url is None:
+            argocd_app_name = self._get_app_name()
+            self.__endpoint_url = "{service}.{namespace}.{domain}".format(
+                service=self.get_config_value('service-name'),
+                namespace=argocd_app_name,
+                domain=self.get_config_value('kube-app-domain')
+            )
+        return self.__endpoint_url
 
     @staticmethod
-    def _get_repo_branch():
-        return sh.git('rev-parse', '--abbrev-ref', 'HEAD').rstrip() # pylint: disable=too-many-function-args
+    def _config_repo_has_branch(git_url, repo_branch):
+        """Determines if the given branch already exists in the remote config repo.
+
+        Parameters
+        ----------
+        git_url : str
+            URL of the remote config repo.
+        repo_branch : str
+            Name of the branch to look for.
+
+        Returns
+        -------
+        bool
+            True if the remote config repo has the given branch, False otherwise.
+        """
+        remote_heads = sh.git( # pylint: disable=too-many-function-args, unexpected-keyword-arg
+            'ls-remote',
+            '--heads',
+            git_url,
+            'refs/heads/' + repo_branch
+        )
+        return bool(str(remote_heads).strip())
+
+    def _get_repo_branch(self):
+        if self.__repo_branch is None:
+            self.__repo_branch = sh.git( # pylint: disable=too-many-function-args
+                'rev-parse',
+                '--abbrev-ref',
+                'HEAD'
+            ).rstrip()
+        return self.__repo_branch
@@ -19,14 +19,20 @@ def deep_merge(dest, source, path=None):
     if path is None:
         path = []
 
-    for key in source:
-        if key in dest:
-            if isinstance(dest[key], dict) and isinstance(source[key], dict):
-                deep_merge(dest[key], source[key], path + [str(key)])
-            elif dest[key] == source[key]:
-                pass # same leaf value
+    # NOTE: walk nested dictionaries with an explicit stack rather then recursing so deeply
+    #       nested configuration does not pay for a python frame per level
+    to_merge = [(dest, source, path)]
+    while to_merge:
+        sub_dest, sub_source, sub_path = to_merge.pop()
+        for key, source_value in sub_source.items():
+            if key in sub_dest:
+                dest_value = sub_dest[key]
+                if isinstance(dest_value, dict) and isinstance(source_value, dict):
+                    to_merge.append((dest_value, source_value, sub_path + [str(key)]))
+                elif dest_value == source_value:
+                    pass # same leaf value
+                else:
+                    raise ValueError('Conflict at %s' % '.'.join(sub_path + [str(key)]))
             else:
-                raise ValueError('Conflict at %s' % '.'.join(path + [str(key)]))
-        else:
-            dest[key] = source[key]
+                sub_dest[key] = source_value
     return dest